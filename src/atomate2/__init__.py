@@ -1,6 +1,22 @@
 """Atomate2 is a library of computational materials science workflows."""
 
+from typing import TYPE_CHECKING, Any
+
 from atomate2._version import __version__
 from atomate2.settings import Atomate2Settings
 
-SETTINGS = Atomate2Settings()
+if TYPE_CHECKING:
+    SETTINGS: Atomate2Settings
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily instantiate the global settings on first access.
+
+    This only avoids reading the config file on a bare ``import atomate2``;
+    submodules that import ``SETTINGS`` still instantiate it when imported.
+    """
+    if name == "SETTINGS":
+        global SETTINGS  # noqa: PLW0603
+        SETTINGS = Atomate2Settings()
+        return SETTINGS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -303,7 +303,7 @@ class AbinitTaskDoc(StructureMetadata):
                 "include_structure": True,
             }
         doc = getattr(cls, attr)(**dat)
-        ddict = doc.dict()
+        ddict = doc.model_dump()
 
         data = {
             "abinit_objects": abinit_objects,
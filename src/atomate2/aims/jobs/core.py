@@ -177,7 +177,7 @@ class SocketIOStaticMaker(BaseAimsMaker):
         # gzip folder
         gzip_output_folder(
             directory=Path.cwd(),
-            setting=SETTINGS.VASP_ZIP_FILES,
+            setting=SETTINGS.vasp.VASP_ZIP_FILES,
             files_list=_FILES_TO_ZIP,
         )
 
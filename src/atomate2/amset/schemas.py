@@ -211,8 +211,7 @@ class AmsetTaskDocument(StructureMetadata):
             log=log,
             **mesh_kwargs,
         )
-        doc.copy(update=additional_fields)
-        return doc
+        return doc.model_copy(update=additional_fields)
 
 
 def _get_structure() -> Structure:
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import contextlib
 from dataclasses import dataclass, field
+from itertools import chain, zip_longest
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -12,6 +12,7 @@ from jobflow import Flow, Maker
 from atomate2.common.jobs.eos import PostProcessEosEnergy, apply_strain_to_structure
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
 
     from jobflow import Job
@@ -39,6 +40,9 @@ class CommonEosMaker(Maker):
         Maker to relax deformed structures for the EOS fit.
     static_maker : .Maker | None
         Maker to generate statics after each relaxation, defaults to None.
+        Each static is given the directory of the relaxation it follows as
+        ``prev_dir``, so makers that copy e.g. WAVECAR/CHGCAR restart from the
+        converged relaxation rather than from scratch.
     strain : tuple[float]
         Percentage linear strain to apply as a deformation, default = -5% to 5%.
     number_of_frames : int
@@ -116,56 +120,70 @@ class CommonEosMaker(Maker):
             self.linear_strain[1],
             self.number_of_frames,
             retstep=True,
+            dtype=np.float64,
         )
 
         if self.initial_relax_maker:
             # Cell without applied strain already included from relax/equilibrium steps.
             # Perturb this point (or these points) if included
             zero_strain_mask = np.abs(strain_l) < 1e-15
-            if np.any(zero_strain_mask):
-                nzs = len(strain_l[zero_strain_mask])
+            if nzs := np.count_nonzero(zero_strain_mask):
                 shift = strain_delta / (nzs + 1.0) * np.linspace(-1.0, 1.0, nzs)
-                strain_l[np.abs(strain_l) < 1e-15] += shift
+                strain_l[zero_strain_mask] += shift
 
-        deformation_l = [(np.identity(3) * (1.0 + eps)).tolist() for eps in strain_l]
+        # build all (N, 3, 3) isotropic deformation matrices in one broadcast; they
+        # are only converted to lists when the transformations are serialized
+        deformation_l = np.eye(3)[None, :, :] * (1.0 + strain_l)[:, None, None]
 
         # apply strain to structures, return list of transformations
         transformations = apply_strain_to_structure(structure, deformation_l)
         jobs["utility"] += [transformations]
 
+        # these are invariant across frames, so resolve them once
+        relax_maker, static_maker = self.eos_relax_maker, self.static_maker
+        # write details of the transformation to the transformations.json file.
+        # This file will automatically get added to the task document and allow
+        # the elastic builder to reconstruct the elastic document. Note the ":"
+        # is automatically converted to a "." in the filename.
+        additional_data = (
+            getattr(relax_maker, "write_additional_data", None)
+            if self._store_transformation_information
+            else None
+        )
+
+        # each deformation depends only on its own transformation (and the optional
+        # equilibrium relaxation), never on other frames, so the frames form
+        # independent branches that the manager is free to run concurrently
+        relax_jobs = []
         for frame_idx in range(self.number_of_frames):
-            if self._store_transformation_information:
-                with contextlib.suppress(Exception):
-                    # write details of the transformation to the
-                    # transformations.json file. This file will automatically get
-                    # added to the task document and allow the elastic builder
-                    # to reconstruct the elastic document. Note the ":"
-                    # is automatically converted to a "." in the filename.
-                    self.eos_relax_maker.write_additional_data[
-                        "transformations:json"
-                    ] = transformations.output[frame_idx]
-
-            relax_job = self.eos_relax_maker.make(
-                structure=transformations.output[frame_idx].final_structure,
-                prev_dir=prev_dir,
+            transformation = transformations.output[frame_idx]
+            if additional_data is not None:
+                additional_data["transformations:json"] = transformation
+
+            relax_job = relax_maker.make(
+                structure=transformation.final_structure, prev_dir=prev_dir
             )
             relax_job.name += f" deformation {frame_idx}"
-            jobs["relax"].append(relax_job)
+            relax_jobs.append(relax_job)
+        jobs["relax"].extend(relax_jobs)
 
-            if self.static_maker:
-                static_job = self.static_maker.make(
+        if static_maker:
+            static_jobs = [
+                static_maker.make(
                     structure=relax_job.output.structure,
                     prev_dir=relax_job.output.dir_name,
                 )
+                for relax_job in relax_jobs
+            ]
+            for frame_idx, static_job in enumerate(static_jobs):
                 static_job.name += f" {frame_idx}"
-                jobs["static"].append(static_job)
+            jobs["static"].extend(static_jobs)
 
         for key in job_types:
-            for idx in range(len(jobs[key])):
-                output = jobs[key][idx].output.output
-                flow_output[key]["energy"] += [output.energy]
-                flow_output[key]["volume"] += [output.structure.volume]
-                flow_output[key]["stress"] += [output.stress]
+            outputs = [job.output.output for job in jobs[key]]
+            flow_output[key]["energy"] = [output.energy for output in outputs]
+            flow_output[key]["volume"] = [output.structure.volume for output in outputs]
+            flow_output[key]["stress"] = [output.stress for output in outputs]
 
         if self.postprocessor is not None:
             min_points = self.postprocessor.min_data_points
@@ -181,8 +199,50 @@ class CommonEosMaker(Maker):
             flow_output = post_process.output
             jobs["utility"] += [post_process]
 
-        job_list = []
-        for key in jobs:
-            job_list += jobs[key]
+        return Flow(
+            jobs=list(chain.from_iterable(jobs.values())),
+            output=flow_output,
+            name=self.name,
+        )
+
+    def make_many(
+        self,
+        structures: Iterable[Structure],
+        prev_dirs: Iterable[str | Path | None] | None = None,
+    ) -> Iterator[Flow]:
+        """Lazily generate EOS flows for many structures.
+
+        Structures are consumed one at a time, so a generator (e.g., over a
+        database query) can be used without holding every structure in memory.
 
-        return Flow(jobs=job_list, output=flow_output, name=self.name)
+        Parameters
+        ----------
+        structures : Iterable[Structure]
+            Pymatgen structure objects.
+        prev_dirs : Iterable[str or Path or None] or None
+            Previous calculation directories to copy output files from, one per
+            structure. Defaults to no previous directory for every structure.
+
+        Yields
+        ------
+        .Flow, an EOS flow for each structure
+
+        Raises
+        ------
+        ValueError
+            If ``prev_dirs`` is given and does not have the same length as
+            ``structures``. As both are consumed lazily, this is only raised once
+            the shorter of the two is exhausted.
+        """
+        if prev_dirs is None:
+            for structure in structures:
+                yield self.make(structure)
+            return
+
+        missing = object()
+        for structure, prev_dir in zip_longest(
+            structures, prev_dirs, fillvalue=missing
+        ):
+            if structure is missing or prev_dir is missing:
+                raise ValueError("structures and prev_dirs must have the same length.")
+            yield self.make(structure, prev_dir=prev_dir)
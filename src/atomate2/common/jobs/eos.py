@@ -326,7 +326,9 @@ class PostProcessEosPressure(EOSPostProcessor):
 
 
 @job
-def apply_strain_to_structure(structure: Structure, deformations: list) -> list:
+def apply_strain_to_structure(
+    structure: Structure, deformations: list | np.ndarray
+) -> list:
     """
     Apply strain(s) to input structure and return transformation(s) as list.
 
@@ -334,13 +336,14 @@ def apply_strain_to_structure(structure: Structure, deformations: list) -> list:
     ----------
     structure: .Structure
         Input structure to apply strain to
-    deformations: list[.Deformation]
+    deformations: list[.Deformation] or np.ndarray
         A list of deformations to apply **independently** to the input
         structure, in anticipation of performing an EOS fit.
         Deformations should be of the form of a 3x3 matrix, e.g.,
         [[1.2, 0., 0.], [0., 1.2, 0.], [0., 0., 1.2]]
         or
-        ((1.2, 0., 0.), (0., 1.2, 0.), (0., 0., 1.2))
+        ((1.2, 0., 0.), (0., 1.2, 0.), (0., 0., 1.2)),
+        or be given together as an array of shape (N, 3, 3).
 
     Returns
     -------
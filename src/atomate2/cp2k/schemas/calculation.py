@@ -438,9 +438,9 @@ class Calculation(BaseModel):
                     k.name.lower(): v for k, v in output_file_paths.items()
                 },
                 bader=bader,
-                run_type=run_type(input_doc.dict()),
-                task_type=task_type(input_doc.dict()),
-                calc_type=calc_type(input_doc.dict()),
+                run_type=run_type(input_doc.model_dump()),
+                task_type=task_type(input_doc.model_dump()),
+                calc_type=calc_type(input_doc.model_dump()),
             ),
             cp2k_objects,
         )
@@ -410,9 +410,9 @@ class TaskDocument(StructureMetadata, MoleculeMetadata):
             "cp2k_objects": cp2k_objects,
             "included_objects": included_objects,
         }
-        doc = cls(**doc.dict())
-        doc = doc.copy(update=data)
-        return doc.copy(update=additional_fields)
+        doc = cls(**doc.model_dump())
+        doc = doc.model_copy(update=data)
+        return doc.model_copy(update=additional_fields)
 
     @staticmethod
     def get_entry(
@@ -1115,7 +1115,7 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
                 # Write the json in iterable format
                 # (Necessary to load large JSON files via ijson)
                 file.write("[")
-                for attribute in doc.model_fields:
+                for attribute in type(doc).model_fields:
                     if attribute not in fields_to_exclude:
                         # Use monty encoder to automatically convert pymatgen
                         # objects and other data json compatible dict format
@@ -1128,7 +1128,7 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
                             )
                         }
                         json.dump(data, file)
-                        if attribute != list(doc.model_fields.keys())[-1]:
+                        if attribute != list(type(doc).model_fields.keys())[-1]:
                             file.write(",")  # add comma separator between two dicts
                         del data
                 file.write("]")
@@ -1356,7 +1356,7 @@ def read_saved_json(
             if isinstance(value, dict):
                 lobster_data[query_key] = MontyDecoder().process_decoded(value)
             elif "lobsterpy_data" in query_key:
-                for field in lobster_data[query_key].__fields__:
+                for field in type(lobster_data[query_key]).model_fields:
                     val = MontyDecoder().process_decoded(
                         getattr(lobster_data[query_key], field)
                     )
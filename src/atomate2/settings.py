@@ -3,15 +3,48 @@
 from __future__ import annotations
 
 import warnings
+from copy import deepcopy
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from atomate2.vasp.settings import VaspSettings
+
 _DEFAULT_CONFIG_FILE_PATH = "~/.atomate2.yaml"
 _ENV_PREFIX = "atomate2_"
 
+# settings owned by atomate2.vasp.settings.VaspSettings; kept here so that the
+# VASP settings module does not need to be imported to separate them
+_VASP_SETTING_NAMES = frozenset(
+    {
+        "DDEC6_ATOMIC_DENSITIES_DIR",
+        "VASP_CMD",
+        "VASP_CUSTODIAN_MAX_ERRORS",
+        "VASP_GAMMA_CMD",
+        "VASP_HANDLE_UNSUCCESSFUL",
+        "VASP_INCAR_UPDATES",
+        "VASP_INHERIT_INCAR",
+        "VASP_NCL_CMD",
+        "VASP_RUN_BADER",
+        "VASP_RUN_DDEC6",
+        "VASP_STORE_ADDITIONAL_JSON",
+        "VASP_STORE_VOLUMETRIC_DATA",
+        "VASP_VDW_KERNEL_DIR",
+        "VASP_VOLUME_CHANGE_WARNING_TOL",
+        "VASP_ZIP_FILES",
+    }
+)
+
+# parsed config files keyed by (path, modification time, size) so that repeated
+# instantiation of Atomate2Settings does not re-parse an unchanged file
+_CONFIG_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
+
 
 class Atomate2Settings(BaseSettings):
     """
@@ -23,6 +56,9 @@ class Atomate2Settings(BaseSettings):
 
     Lastly, the variables can be modified directly through environment variables by
     using the "ATOMATE2" prefix. E.g. ATOMATE2_SCRATCH_DIR = path/to/scratch.
+
+    VASP specific settings are available through the :obj:`vasp` attribute, which
+    is only loaded when first accessed. They are read from the same config file.
     """
 
     CONFIG_FILE: str = Field(
@@ -42,78 +78,6 @@ class Atomate2Settings(BaseSettings):
         None, description="Path to scratch directory used by custodian."
     )
 
-    # VASP specific settings
-    VASP_CMD: str = Field(
-        "vasp_std", description="Command to run standard version of VASP."
-    )
-    VASP_GAMMA_CMD: str = Field(
-        "vasp_gam", description="Command to run gamma-only version of VASP."
-    )
-    VASP_NCL_CMD: str = Field(
-        "vasp_ncl", description="Command to run non-collinear version of VASP."
-    )
-    VASP_VDW_KERNEL_DIR: Optional[str] = Field(
-        None, description="Path to VDW VASP kernel."
-    )
-    VASP_INCAR_UPDATES: dict = Field(
-        default_factory=dict, description="Updates to apply to VASP INCAR files."
-    )
-    VASP_VOLUME_CHANGE_WARNING_TOL: float = Field(
-        0.2,
-        description="Maximum volume change allowed in VASP relaxations before the "
-        "calculation is tagged with a warning",
-    )
-    VASP_HANDLE_UNSUCCESSFUL: Union[bool, Literal["error"]] = Field(
-        "error",
-        description="Three-way toggle on what to do if the job looks OK but is actually"
-        " unconverged (either electronic or ionic). - True: mark job as COMPLETED, but "
-        "stop children. - False: do nothing, continue with workflow as normal. 'error':"
-        " throw an error",
-    )
-    VASP_CUSTODIAN_MAX_ERRORS: int = Field(
-        5, description="Maximum number of errors to correct before custodian gives up"
-    )
-    VASP_STORE_VOLUMETRIC_DATA: Optional[tuple[str]] = Field(
-        None, description="Store data from these files in database if present"
-    )
-    VASP_STORE_ADDITIONAL_JSON: bool = Field(
-        default=True,
-        description="Ingest any additional JSON data present into database when "
-        "parsing VASP directories useful for storing duplicate of FW.json",
-    )
-    VASP_RUN_BADER: bool = Field(
-        default=False,
-        description="Whether to run the Bader program when parsing VASP calculations."
-        "Requires the bader executable to be on the path.",
-    )
-    VASP_RUN_DDEC6: bool = Field(
-        default=False,
-        description="Whether to run the DDEC6 program when parsing VASP calculations."
-        "Requires the chargemol executable to be on the path.",
-    )
-    DDEC6_ATOMIC_DENSITIES_DIR: Optional[str] = Field(
-        default=None,
-        description="Directory where the atomic densities are stored.",
-        # TODO uncomment below once that functionality is actually implemented
-        # If not set, pymatgen tries to auto-download the densities and extract them
-        # into ~/.cache/pymatgen/ddec
-    )
-
-    VASP_ZIP_FILES: Union[bool, Literal["atomate"]] = Field(
-        "atomate",
-        description="Determine if the files in folder are being compressed. If True "
-        "all the files are compressed. If 'atomate' only a selection of files related "
-        "to the simulation will be compressed. If False no file is compressed.",
-    )
-    VASP_INHERIT_INCAR: bool = Field(
-        default=False,
-        description="Whether to inherit INCAR settings from previous calculation. "
-        "This might be useful to port Custodian fixes to child jobs but can also be "
-        "dangerous e.g. when switching from GGA to meta-GGA or relax to static jobs."
-        "Can be overridden on a per-job basis via the inherit_incar keyword of "
-        "VaspInputGenerator.",
-    )
-
     LOBSTER_CMD: str = Field(
         default="lobster", description="Command to run standard version of VASP."
     )
@@ -240,6 +204,23 @@ class Atomate2Settings(BaseSettings):
         "parsing QChem directories useful for storing duplicate of FW.json",
     )
 
+    # deprecated VASP settings passed explicitly, forwarded to VaspSettings
+    _vasp_kwargs: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, **kwargs: Any) -> None:
+        vasp_kwargs = {
+            key: kwargs.pop(key) for key in kwargs.keys() & _VASP_SETTING_NAMES
+        }
+        if vasp_kwargs:
+            warnings.warn(
+                f"Passing {', '.join(sorted(vasp_kwargs))} to Atomate2Settings is "
+                "deprecated, pass VASP settings to VaspSettings instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        super().__init__(**kwargs)
+        self._vasp_kwargs = vasp_kwargs
+
     @model_validator(mode="before")
     @classmethod
     def load_default_settings(cls, values: dict[str, Any]) -> dict[str, Any]:
@@ -250,30 +231,86 @@ class Atomate2Settings(BaseSettings):
 
         This allows setting of the config file path through environment variables.
         """
-        from monty.serialization import loadfn
+        # VASP settings in the shared config file are validated by VaspSettings
+        return _load_config_file_values(values, exclude=_VASP_SETTING_NAMES)
+
+    @cached_property
+    def vasp(self) -> VaspSettings:
+        """VASP settings, loaded from the same config file on first access."""
+        from atomate2.vasp.settings import VaspSettings
+
+        return VaspSettings(CONFIG_FILE=self.CONFIG_FILE, **self._vasp_kwargs)
+
+    if not TYPE_CHECKING:
+        # only defined at runtime so that type checkers still flag unknown settings
 
-        config_file_path = values.get(key := "CONFIG_FILE", _DEFAULT_CONFIG_FILE_PATH)
-        env_var_name = f"{_ENV_PREFIX.upper()}{key}"
-        config_file_path = Path(config_file_path).expanduser()
+        def __getattr__(self, name: str) -> Any:
+            """Forward deprecated VASP settings to :obj:`vasp`."""
+            if name in _VASP_SETTING_NAMES:
+                warnings.warn(
+                    f"Atomate2Settings.{name} is deprecated, use "
+                    f"Atomate2Settings.vasp.{name} instead.",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
+                return getattr(self.vasp, name)
+            return super().__getattr__(name)
 
-        new_values = {}
-        if config_file_path.exists():
-            if config_file_path.stat().st_size == 0:
+        def __setattr__(self, name: str, value: Any) -> None:
+            """Forward deprecated VASP settings to :obj:`vasp`."""
+            if name in _VASP_SETTING_NAMES:
                 warnings.warn(
-                    f"Using {env_var_name} at {config_file_path} but it's empty",
+                    f"Atomate2Settings.{name} is deprecated, use "
+                    f"Atomate2Settings.vasp.{name} instead.",
+                    DeprecationWarning,
                     stacklevel=2,
                 )
+                setattr(self.vasp, name, value)
             else:
-                try:
-                    new_values.update(loadfn(config_file_path))
-                except ValueError:
-                    raise SyntaxError(
-                        f"{env_var_name} at {config_file_path} is unparsable"
-                    ) from None
-        # warn if config path is not the default but file doesn't exist
-        elif config_file_path != Path(_DEFAULT_CONFIG_FILE_PATH).expanduser():
+                super().__setattr__(name, value)
+
+
+def _load_config_file_values(
+    values: dict[str, Any], exclude: Collection[str] = ()
+) -> dict[str, Any]:
+    """Merge settings from the config file underneath explicitly given values.
+
+    Shared by :obj:`Atomate2Settings` and the code-specific settings classes so that
+    all of them are read from the same config file. Settings in ``exclude`` are
+    owned by another settings class and are dropped from the config file values.
+    """
+    from monty.serialization import loadfn
+
+    config_file_path = values.get(key := "CONFIG_FILE", _DEFAULT_CONFIG_FILE_PATH)
+    env_var_name = f"{_ENV_PREFIX.upper()}{key}"
+    config_file_path = Path(config_file_path).expanduser()
+
+    new_values = {}
+    if config_file_path.exists():
+        stat = config_file_path.stat()
+        if stat.st_size == 0:
             warnings.warn(
-                f"{env_var_name} at {config_file_path} does not exist", stacklevel=2
+                f"Using {env_var_name} at {config_file_path} but it's empty",
+                stacklevel=2,
+            )
+        else:
+            cache_key = (str(config_file_path), stat.st_mtime_ns, stat.st_size)
+            try:
+                if cache_key not in _CONFIG_CACHE:
+                    _CONFIG_CACHE[cache_key] = dict(loadfn(config_file_path))
+            except ValueError:
+                raise SyntaxError(
+                    f"{env_var_name} at {config_file_path} is unparsable"
+                ) from None
+            new_values.update(
+                (key, deepcopy(val))
+                for key, val in _CONFIG_CACHE[cache_key].items()
+                if key not in exclude
             )
+    # warn if config path is not the default but file doesn't exist
+    elif config_file_path != Path(_DEFAULT_CONFIG_FILE_PATH).expanduser():
+        warnings.warn(
+            f"{env_var_name} at {config_file_path} does not exist", stacklevel=2
+        )
 
-        return {**new_values, **values}
+    return {**new_values, **values}
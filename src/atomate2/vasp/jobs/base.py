@@ -235,7 +235,7 @@ class BaseVaspMaker(Maker):
         # gzip folder
         gzip_output_folder(
             directory=Path.cwd(),
-            setting=SETTINGS.VASP_ZIP_FILES,
+            setting=SETTINGS.vasp.VASP_ZIP_FILES,
             files_list=_FILES_TO_ZIP,
         )
 
@@ -248,44 +248,46 @@ class BaseVaspMaker(Maker):
 
 def get_vasp_task_document(path: Path | str, **kwargs) -> TaskDoc:
     """Get VASP Task Document using atomate2 settings."""
-    kwargs.setdefault("store_additional_json", SETTINGS.VASP_STORE_ADDITIONAL_JSON)
+    vasp_settings = SETTINGS.vasp
+    kwargs.setdefault("store_additional_json", vasp_settings.VASP_STORE_ADDITIONAL_JSON)
 
     kwargs.setdefault(
-        "volume_change_warning_tol", SETTINGS.VASP_VOLUME_CHANGE_WARNING_TOL
+        "volume_change_warning_tol", vasp_settings.VASP_VOLUME_CHANGE_WARNING_TOL
     )
 
-    if SETTINGS.VASP_RUN_BADER:
+    if vasp_settings.VASP_RUN_BADER:
         kwargs.setdefault("run_bader", _BADER_EXE_EXISTS)
         if not _BADER_EXE_EXISTS:
             warnings.warn(
-                f"{SETTINGS.VASP_RUN_BADER=} but bader executable not found on path",
+                f"{vasp_settings.VASP_RUN_BADER=} but bader executable not found on "
+                "path",
                 stacklevel=1,
             )
-    if SETTINGS.VASP_RUN_DDEC6:
+    if vasp_settings.VASP_RUN_DDEC6:
         # if VASP_RUN_DDEC6 is True but _CHARGEMOL_EXE_EXISTS is False, just silently
         # skip running DDEC6
         run_ddec6: bool | str = _CHARGEMOL_EXE_EXISTS
-        if run_ddec6 and isinstance(SETTINGS.DDEC6_ATOMIC_DENSITIES_DIR, str):
+        if run_ddec6 and isinstance(vasp_settings.DDEC6_ATOMIC_DENSITIES_DIR, str):
             # if DDEC6_ATOMIC_DENSITIES_DIR is a string and directory at that path
             # exists, use as path to the atomic densities
-            if Path(SETTINGS.DDEC6_ATOMIC_DENSITIES_DIR).is_dir():
-                run_ddec6 = SETTINGS.DDEC6_ATOMIC_DENSITIES_DIR
+            if Path(vasp_settings.DDEC6_ATOMIC_DENSITIES_DIR).is_dir():
+                run_ddec6 = vasp_settings.DDEC6_ATOMIC_DENSITIES_DIR
             else:
                 # if the directory doesn't exist, warn the user and skip running DDEC6
                 warnings.warn(
-                    f"{SETTINGS.DDEC6_ATOMIC_DENSITIES_DIR=} does not exist, skipping "
-                    "DDEC6",
+                    f"{vasp_settings.DDEC6_ATOMIC_DENSITIES_DIR=} does not exist, "
+                    "skipping DDEC6",
                     stacklevel=1,
                 )
         kwargs.setdefault("run_ddec6", run_ddec6)
 
         if not _CHARGEMOL_EXE_EXISTS:
             warnings.warn(
-                f"{SETTINGS.VASP_RUN_DDEC6=} but chargemol executable not found on "
-                "path",
+                f"{vasp_settings.VASP_RUN_DDEC6=} but chargemol executable not found "
+                "on path",
                 stacklevel=1,
             )
 
-    kwargs.setdefault("store_volumetric_data", SETTINGS.VASP_STORE_VOLUMETRIC_DATA)
+    kwargs.setdefault("store_volumetric_data", vasp_settings.VASP_STORE_VOLUMETRIC_DATA)
 
     return TaskDoc.from_directory(path, **kwargs)
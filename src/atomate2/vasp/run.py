@@ -83,9 +83,9 @@ class JobType(ValueEnum):
 
 def run_vasp(
     job_type: JobType | str = JobType.NORMAL,
-    vasp_cmd: str = SETTINGS.VASP_CMD,
-    vasp_gamma_cmd: str = SETTINGS.VASP_GAMMA_CMD,
-    max_errors: int = SETTINGS.VASP_CUSTODIAN_MAX_ERRORS,
+    vasp_cmd: str = None,
+    vasp_gamma_cmd: str = None,
+    max_errors: int = None,
     scratch_dir: str = SETTINGS.CUSTODIAN_SCRATCH_DIR,
     handlers: Sequence[ErrorHandler] = DEFAULT_HANDLERS,
     validators: Sequence[Validator] = _DEFAULT_VALIDATORS,
@@ -103,11 +103,14 @@ def run_vasp(
     job_type : str or .JobType
         The job type.
     vasp_cmd : str
-        The command used to run the standard version of vasp.
+        The command used to run the standard version of vasp. Defaults to
+        ``SETTINGS.vasp.VASP_CMD``.
     vasp_gamma_cmd : str
-        The command used to run the gamma version of vasp.
+        The command used to run the gamma version of vasp. Defaults to
+        ``SETTINGS.vasp.VASP_GAMMA_CMD``.
     max_errors : int
-        The maximum number of errors allowed by custodian.
+        The maximum number of errors allowed by custodian. Defaults to
+        ``SETTINGS.vasp.VASP_CUSTODIAN_MAX_ERRORS``.
     scratch_dir : str
         The scratch directory used by custodian.
     handlers : list of .ErrorHandler
@@ -125,6 +128,15 @@ def run_vasp(
     vasp_job_kwargs = vasp_job_kwargs or {}
     custodian_kwargs = custodian_kwargs or {}
 
+    # read VASP settings here rather than as argument defaults so that they are
+    # only loaded when VASP is actually run
+    if vasp_cmd is None:
+        vasp_cmd = SETTINGS.vasp.VASP_CMD
+    if vasp_gamma_cmd is None:
+        vasp_gamma_cmd = SETTINGS.vasp.VASP_GAMMA_CMD
+    if max_errors is None:
+        max_errors = SETTINGS.vasp.VASP_CUSTODIAN_MAX_ERRORS
+
     vasp_cmd = expandvars(vasp_cmd)
     vasp_gamma_cmd = expandvars(vasp_gamma_cmd)
     split_vasp_cmd = shlex.split(vasp_cmd)
@@ -169,7 +181,7 @@ def run_vasp(
 
 def should_stop_children(
     task_document: TaskDoc,
-    handle_unsuccessful: bool | str = SETTINGS.VASP_HANDLE_UNSUCCESSFUL,
+    handle_unsuccessful: bool | str = None,
 ) -> bool:
     """
     Parse VASP outputs and decide whether child jobs should continue.
@@ -186,6 +198,8 @@ def should_stop_children(
         - `False`: Do nothing, continue with workflow as normal.
         - `"error"`: Throw an error.
 
+        Defaults to ``SETTINGS.vasp.VASP_HANDLE_UNSUCCESSFUL``.
+
     Returns
     -------
     bool
@@ -194,6 +208,9 @@ def should_stop_children(
     if task_document.state == "successful":
         return False
 
+    if handle_unsuccessful is None:
+        handle_unsuccessful = SETTINGS.vasp.VASP_HANDLE_UNSUCCESSFUL
+
     if isinstance(handle_unsuccessful, bool):
         return handle_unsuccessful
 
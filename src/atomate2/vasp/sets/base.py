@@ -371,7 +371,7 @@ class VaspInputGenerator(InputGenerator):
                 self.config_dict["POTCAR"][k] = v
 
         if self.inherit_incar is None:
-            self.inherit_incar = SETTINGS.VASP_INHERIT_INCAR
+            self.inherit_incar = SETTINGS.vasp.VASP_INHERIT_INCAR
 
     def get_input_set(
         self,
@@ -0,0 +1,116 @@
+"""Settings for VASP workflows in atomate2."""
+
+from __future__ import annotations
+
+from typing import Any, Literal, Optional, Union
+
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from atomate2.settings import (
+    _DEFAULT_CONFIG_FILE_PATH,
+    _ENV_PREFIX,
+    Atomate2Settings,
+    _load_config_file_values,
+)
+
+
+class VaspSettings(BaseSettings):
+    """
+    Settings for VASP workflows in atomate2.
+
+    These are read from the same config file and environment variables as
+    :obj:`.Atomate2Settings`, e.g. ATOMATE2_VASP_CMD = vasp_std. They are kept
+    separate so that they are only loaded once VASP workflows are used, through
+    ``atomate2.SETTINGS.vasp``.
+    """
+
+    CONFIG_FILE: str = Field(
+        _DEFAULT_CONFIG_FILE_PATH, description="File to load alternative defaults from."
+    )
+
+    VASP_CMD: str = Field(
+        "vasp_std", description="Command to run standard version of VASP."
+    )
+    VASP_GAMMA_CMD: str = Field(
+        "vasp_gam", description="Command to run gamma-only version of VASP."
+    )
+    VASP_NCL_CMD: str = Field(
+        "vasp_ncl", description="Command to run non-collinear version of VASP."
+    )
+    VASP_VDW_KERNEL_DIR: Optional[str] = Field(
+        None, description="Path to VDW VASP kernel."
+    )
+    VASP_INCAR_UPDATES: dict = Field(
+        default_factory=dict, description="Updates to apply to VASP INCAR files."
+    )
+    VASP_VOLUME_CHANGE_WARNING_TOL: float = Field(
+        0.2,
+        description="Maximum volume change allowed in VASP relaxations before the "
+        "calculation is tagged with a warning",
+    )
+    VASP_HANDLE_UNSUCCESSFUL: Union[bool, Literal["error"]] = Field(
+        "error",
+        description="Three-way toggle on what to do if the job looks OK but is actually"
+        " unconverged (either electronic or ionic). - True: mark job as COMPLETED, but "
+        "stop children. - False: do nothing, continue with workflow as normal. 'error':"
+        " throw an error",
+    )
+    VASP_CUSTODIAN_MAX_ERRORS: int = Field(
+        5, description="Maximum number of errors to correct before custodian gives up"
+    )
+    VASP_STORE_VOLUMETRIC_DATA: Optional[tuple[str]] = Field(
+        None, description="Store data from these files in database if present"
+    )
+    VASP_STORE_ADDITIONAL_JSON: bool = Field(
+        default=True,
+        description="Ingest any additional JSON data present into database when "
+        "parsing VASP directories useful for storing duplicate of FW.json",
+    )
+    VASP_RUN_BADER: bool = Field(
+        default=False,
+        description="Whether to run the Bader program when parsing VASP calculations."
+        "Requires the bader executable to be on the path.",
+    )
+    VASP_RUN_DDEC6: bool = Field(
+        default=False,
+        description="Whether to run the DDEC6 program when parsing VASP calculations."
+        "Requires the chargemol executable to be on the path.",
+    )
+    DDEC6_ATOMIC_DENSITIES_DIR: Optional[str] = Field(
+        default=None,
+        description="Directory where the atomic densities are stored.",
+        # TODO uncomment below once that functionality is actually implemented
+        # If not set, pymatgen tries to auto-download the densities and extract them
+        # into ~/.cache/pymatgen/ddec
+    )
+
+    VASP_ZIP_FILES: Union[bool, Literal["atomate"]] = Field(
+        "atomate",
+        description="Determine if the files in folder are being compressed. If True "
+        "all the files are compressed. If 'atomate' only a selection of files related "
+        "to the simulation will be compressed. If False no file is compressed.",
+    )
+    VASP_INHERIT_INCAR: bool = Field(
+        default=False,
+        description="Whether to inherit INCAR settings from previous calculation. "
+        "This might be useful to port Custodian fixes to child jobs but can also be "
+        "dangerous e.g. when switching from GGA to meta-GGA or relax to static jobs."
+        "Can be overridden on a per-job basis via the inherit_incar keyword of "
+        "VaspInputGenerator.",
+    )
+
+    model_config = SettingsConfigDict(env_prefix=_ENV_PREFIX)
+
+    @model_validator(mode="before")
+    @classmethod
+    def load_default_settings(cls, values: dict[str, Any]) -> dict[str, Any]:
+        """Load settings from file or environment variables.
+
+        Loads settings from a root file if available and uses that as defaults in
+        place of built-in defaults.
+        """
+        # general settings in the shared config file are validated by
+        # Atomate2Settings
+        exclude = set(Atomate2Settings.model_fields).difference({"CONFIG_FILE"})
+        return _load_config_file_values(values, exclude=exclude)
@@ -154,3 +154,12 @@ def test_apply_strain_to_structure(clean_dir, si_structure):
         transformations[i].final_structure.volume == approx(expected)
         for i, expected in enumerate(expected_volumes)
     )
+
+    # deformations can also be passed as a single (N, 3, 3) array
+    job = apply_strain_to_structure(si_structure, np.array(deformations))
+    response = run_locally(job)
+    transformations = response[job.uuid][1].output
+
+    assert [ts.final_structure.volume for ts in transformations] == approx(
+        expected_volumes
+    )
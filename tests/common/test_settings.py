@@ -1,9 +1,18 @@
+import subprocess
+import sys
 from pathlib import Path
 
+import monty.serialization
 import pytest
 from pydantic import ValidationError
 
-from atomate2.settings import _DEFAULT_CONFIG_FILE_PATH, _ENV_PREFIX, Atomate2Settings
+from atomate2.settings import (
+    _DEFAULT_CONFIG_FILE_PATH,
+    _ENV_PREFIX,
+    _VASP_SETTING_NAMES,
+    Atomate2Settings,
+)
+from atomate2.vasp.settings import VaspSettings
 
 
 def test_empty_and_invalid_config_file(
@@ -26,9 +35,9 @@ def test_empty_and_invalid_config_file(
     assert str(config_file_path) == settings.CONFIG_FILE
     assert settings.SYMPREC == 0.1
     assert settings.BANDGAP_TOL == 1e-4
-    assert settings.VASP_RUN_BADER is False
-    assert settings.VASP_RUN_DDEC6 is False
-    assert settings.DDEC6_ATOMIC_DENSITIES_DIR is None
+    assert settings.vasp.VASP_RUN_BADER is False
+    assert settings.vasp.VASP_RUN_DDEC6 is False
+    assert settings.vasp.DDEC6_ATOMIC_DENSITIES_DIR is None
 
     # test warning if config file exists but is empty
     config_file_path.touch()
@@ -46,10 +55,22 @@ def test_empty_and_invalid_config_file(
         file.write("VASP_CMD: 42")
     with pytest.raises(
         ValidationError,
-        match="1 validation error for Atomate2Settings\nVASP_CMD\n  "
+        match="1 validation error for VaspSettings\nVASP_CMD\n  "
         "Input should be a valid string ",
     ):
-        Atomate2Settings()
+        VaspSettings()
+
+    # test error if the file contains an unknown setting, VASP settings are validated
+    # separately but the config file is still checked for typos by both classes
+    with open(config_file_path, "w") as file:
+        file.write("VASP_CMDD: foo")
+    for settings_cls in (Atomate2Settings, VaspSettings):
+        with pytest.raises(
+            ValidationError,
+            match=f"1 validation error for {settings_cls.__name__}\nVASP_CMDD\n  "
+            "Extra inputs are not permitted",
+        ):
+            settings_cls()
 
     # another invalid setting
     with open(config_file_path, "w") as file:
@@ -65,3 +86,86 @@ def test_empty_and_invalid_config_file(
     config_file_path.unlink()
     with pytest.warns(UserWarning, match=f"{env_var_name} at .+ does not exist"):
         Atomate2Settings()
+
+
+def test_config_file_cached(clean_dir, monkeypatch: pytest.MonkeyPatch):
+    config_file_path = Path.cwd() / "test-atomate2-config.yaml"
+    monkeypatch.setenv(f"{_ENV_PREFIX.upper()}CONFIG_FILE", str(config_file_path))
+
+    parsed_files = []
+    loadfn = monty.serialization.loadfn
+
+    def counting_loadfn(fname, *args, **kwargs):
+        parsed_files.append(fname)
+        return loadfn(fname, *args, **kwargs)
+
+    monkeypatch.setattr(monty.serialization, "loadfn", counting_loadfn)
+
+    # an unchanged config file is only parsed once
+    config_file_path.write_text("SYMPREC: 0.2")
+    assert Atomate2Settings().SYMPREC == 0.2
+    assert Atomate2Settings().SYMPREC == 0.2
+    assert len(parsed_files) == 1
+
+    # an edited config file must not be served from the cache
+    config_file_path.write_text("SYMPREC: 0.35")
+    assert Atomate2Settings().SYMPREC == 0.35
+    assert len(parsed_files) == 2
+
+
+def test_vasp_settings(clean_dir, monkeypatch: pytest.MonkeyPatch):
+    config_file_path = Path.cwd() / "test-atomate2-config.yaml"
+    monkeypatch.setenv(f"{_ENV_PREFIX.upper()}CONFIG_FILE", str(config_file_path))
+    monkeypatch.setenv(f"{_ENV_PREFIX.upper()}VASP_GAMMA_CMD", "vasp_gam_env")
+
+    # general and VASP settings are read from the same config file
+    config_file_path.write_text("SYMPREC: 0.2\nVASP_CMD: mpirun vasp_std")
+    settings = Atomate2Settings()
+    assert settings.SYMPREC == 0.2
+    assert "vasp" not in vars(settings)
+
+    assert isinstance(settings.vasp, VaspSettings)
+    assert settings.vasp is settings.vasp
+    assert settings.vasp.VASP_CMD == "mpirun vasp_std"
+    assert settings.vasp.VASP_GAMMA_CMD == "vasp_gam_env"
+    assert VaspSettings().VASP_CMD == "mpirun vasp_std"
+
+
+def test_deprecated_vasp_settings(clean_dir, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(f"{_ENV_PREFIX.upper()}CONFIG_FILE", raising=False)
+
+    settings = Atomate2Settings()
+    with pytest.warns(DeprecationWarning, match="use Atomate2Settings.vasp.VASP_CMD"):
+        assert settings.VASP_CMD == settings.vasp.VASP_CMD
+    with pytest.raises(AttributeError):
+        _ = settings.NOT_A_SETTING
+
+    with pytest.warns(DeprecationWarning, match="use Atomate2Settings.vasp.VASP_CMD"):
+        settings.VASP_CMD = "vasp_set"
+    assert settings.vasp.VASP_CMD == "vasp_set"
+    with pytest.warns(DeprecationWarning, match="VASP_INCAR_UPDATES"):
+        settings.VASP_INCAR_UPDATES = {"NCORE": 4}
+    assert settings.vasp.VASP_INCAR_UPDATES == {"NCORE": 4}
+
+    # VASP settings passed explicitly are forwarded to VaspSettings
+    with pytest.warns(DeprecationWarning, match="Passing VASP_CMD to Atomate2Settings"):
+        settings = Atomate2Settings(VASP_CMD="vasp_explicit")
+    assert settings.vasp.VASP_CMD == "vasp_explicit"
+
+
+def test_vasp_setting_names():
+    # Atomate2Settings separates VASP settings without importing VaspSettings
+    assert frozenset(VaspSettings.model_fields) - {"CONFIG_FILE"} == (
+        _VASP_SETTING_NAMES
+    )
+
+
+def test_settings_lazily_instantiated():
+    # run in a fresh interpreter as SETTINGS is already created in the test session
+    code = (
+        "import atomate2\n"
+        "assert 'SETTINGS' not in vars(atomate2)\n"
+        "from atomate2 import SETTINGS\n"
+        "assert vars(atomate2)['SETTINGS'] is SETTINGS\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -182,3 +182,43 @@ def test_mp_eos_maker(
                 )
             elif isinstance(data, (float, int)):
                 assert approx(ref_eos_fit[job_type][key]) == data
+
+
+def test_eos_maker_make_many(vasp_test_dir):
+    structure = Structure.from_file(
+        f"{vasp_test_dir}/Si_EOS_MP_GGA/mp-149-PBE-EOS_MP_GGA_relax_1/inputs/POSCAR"
+    )
+    maker = MPGGAEosMaker(number_of_frames=6)
+
+    flows = maker.make_many(structure.copy() for _ in range(3))
+    assert not isinstance(flows, list)
+
+    flows = list(flows)
+    assert len(flows) == 3
+    for flow in flows:
+        assert isinstance(flow, Flow)
+        assert flow.name == maker.name
+        assert len(flow.jobs) == len(maker.make(structure).jobs)
+
+
+def test_eos_maker_make_many_prev_dirs(vasp_test_dir):
+    structure = Structure.from_file(
+        f"{vasp_test_dir}/Si_EOS_MP_GGA/mp-149-PBE-EOS_MP_GGA_relax_1/inputs/POSCAR"
+    )
+    structures = [structure.copy() for _ in range(3)]
+    for idx, struct in enumerate(structures):
+        struct.scale_lattice((1.0 + 0.01 * idx) * structure.volume)
+    prev_dirs = [f"prev_dir_{idx}" for idx in range(3)]
+    maker = MPGGAEosMaker()
+
+    flows = list(maker.make_many(iter(structures), prev_dirs=iter(prev_dirs)))
+    assert len(flows) == 3
+    for flow, struct, prev_dir in zip(flows, structures, prev_dirs):
+        # first job of the initial double relaxation
+        relax_job = flow.jobs[0].jobs[0]
+        assert relax_job.function_args[0] == struct
+        assert relax_job.function_kwargs["prev_dir"] == prev_dir
+
+    for n_prev_dirs in (2, 4):
+        with pytest.raises(ValueError, match="must have the same length"):
+            list(maker.make_many(structures, prev_dirs=prev_dirs[:1] * n_prev_dirs))